@@ -71,7 +71,7 @@ class TransitionRecord:
 # Base Phase Context
 # =============================================================================
 
-@dataclass
+@dataclass(slots=True)
 class BasePhaseContext:
     """
     Base context that persists across phase visits.
@@ -167,6 +167,8 @@ class SSEEventEmitter:
     Used by agents and tools to send real-time updates to the frontend.
     """
 
+    __slots__ = ("_emit", "_queue")
+
     def __init__(self, emit_fn: Callable[[SSEEvent], Awaitable[None]]):
         self._emit = emit_fn
         self._queue: list[SSEEvent] = []
@@ -588,6 +590,25 @@ class BaseForgeAgent(ABC, Generic[PhaseType, ContextType]):
         # Default: auto-approve
         return CheckpointResponse(approved=True)
 
+    async def _request_checkpoint(
+        self,
+        checkpoint_id: str,
+        build_message: Callable[[], str],
+        options: list[str],
+    ) -> CheckpointResponse:
+        """
+        Handle a blocking checkpoint whose message is built on demand.
+
+        The message is only formatted when a checkpoint handler will show
+        it; without a handler the checkpoint auto-approves.
+        """
+        if not self._checkpoint_handler:
+            return CheckpointResponse(approved=True)
+
+        return await self._handle_checkpoint(
+            Checkpoint(id=checkpoint_id, message=build_message(), options=options)
+        )
+
     # =========================================================================
     # Utility Methods
     # =========================================================================
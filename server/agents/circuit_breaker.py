@@ -0,0 +1,79 @@
+"""
+Circuit breaker for upstream SDK calls.
+
+After repeated failures the breaker opens and phase execution fails fast
+instead of starting a new SDK client, until a recovery timeout has passed.
+One breaker is shared by the Research and Understand agents, since they
+talk to the same upstream and agents are recreated for every chat message.
+"""
+
+from __future__ import annotations
+
+from time import monotonic
+from typing import Optional
+
+
+class CircuitOpenError(Exception):
+    """Raised when a call is refused because the circuit is open."""
+    pass
+
+
+class CircuitBreaker:
+    """
+    Consecutive-failure circuit breaker.
+
+    Opens after `failure_threshold` consecutive failures. Once
+    `recovery_timeout` seconds have passed, the circuit is half-open: a
+    single probe call is let through while others are still refused. A
+    success closes the circuit and a failure re-opens it. A probe that
+    never reports back is abandoned after another `recovery_timeout`.
+    """
+
+    def __init__(self, failure_threshold: int = 3, recovery_timeout: float = 30.0):
+        self.failure_threshold = failure_threshold
+        self.recovery_timeout = recovery_timeout
+        self._failures = 0
+        self._opened_at: Optional[float] = None
+        self._probe_started: Optional[float] = None
+
+    @property
+    def is_open(self) -> bool:
+        """Whether calls should currently be refused."""
+        if self._opened_at is None:
+            return False
+        now = monotonic()
+        if now - self._opened_at < self.recovery_timeout:
+            return True
+        # Half-open: refuse while a probe is in flight
+        return (
+            self._probe_started is not None
+            and now - self._probe_started < self.recovery_timeout
+        )
+
+    def check(self) -> None:
+        """Raise CircuitOpenError if the circuit is open."""
+        if self.is_open:
+            raise CircuitOpenError(
+                f"Upstream unavailable after {self._failures} consecutive failures; "
+                f"retry in {self.recovery_timeout:.0f}s"
+            )
+        if self._opened_at is not None:
+            # This call is the half-open probe
+            self._probe_started = monotonic()
+
+    def record_success(self) -> None:
+        """Close the circuit."""
+        self._failures = 0
+        self._opened_at = None
+        self._probe_started = None
+
+    def record_failure(self) -> None:
+        """Count a failure, opening the circuit at the threshold or after a failed probe."""
+        self._failures += 1
+        if self._failures >= self.failure_threshold or self._probe_started is not None:
+            self._opened_at = monotonic()
+            self._probe_started = None
+
+
+# Shared breaker for ClaudeSDKClient calls
+sdk_breaker = CircuitBreaker()
@@ -12,9 +12,12 @@ Log files are stored in server/logs/ with session ID prefix.
 
 from __future__ import annotations
 
+import atexit
 import json
 import logging
+import queue
 from datetime import datetime, timezone
+from logging.handlers import QueueHandler, QueueListener
 from pathlib import Path
 from typing import Any, Optional
 
@@ -23,6 +26,39 @@ LOG_DIR = Path(__file__).parent.parent / "logs"
 LOG_DIR.mkdir(exist_ok=True)
 
 
+class _LoggerRouter(logging.Handler):
+    """Dispatch queued records to the file/console handlers of their logger."""
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.routes: dict[str, list[logging.Handler]] = {}
+
+    def handle(self, record: logging.LogRecord) -> bool:
+        for handler in self.routes.get(record.name, ()):
+            if record.levelno >= handler.level:
+                handler.handle(record)
+        return True
+
+    def emit(self, record: logging.LogRecord) -> None:
+        self.handle(record)
+
+
+# Agent loggers only enqueue records; a single listener thread does the
+# file and console writes so they never block the event loop.
+_log_queue: queue.SimpleQueue = queue.SimpleQueue()
+_router = _LoggerRouter()
+_listener: Optional[QueueListener] = None
+
+
+def _ensure_listener() -> None:
+    """Start the background log writer on first use."""
+    global _listener
+    if _listener is None:
+        _listener = QueueListener(_log_queue, _router)
+        _listener.start()
+        atexit.register(_listener.stop)
+
+
 def get_agent_logger(session_id: str, agent_type: str) -> logging.Logger:
     """
     Get a logger for an agent session.
@@ -41,6 +77,7 @@ def get_agent_logger(session_id: str, agent_type: str) -> logging.Logger:
 
     # Only add handler if not already added
     if not logger.handlers:
+        _ensure_listener()
         logger.setLevel(logging.DEBUG)
 
         # File handler
@@ -53,13 +90,14 @@ def get_agent_logger(session_id: str, agent_type: str) -> logging.Logger:
             datefmt='%H:%M:%S'
         )
         fh.setFormatter(formatter)
-        logger.addHandler(fh)
 
         # Also log to console at INFO level
         ch = logging.StreamHandler()
         ch.setLevel(logging.INFO)
         ch.setFormatter(formatter)
-        logger.addHandler(ch)
+
+        _router.routes[logger_name] = [fh, ch]
+        logger.addHandler(QueueHandler(_log_queue))
 
     logger.info(f"Agent log started: {log_file}")
     return logger
@@ -90,7 +128,7 @@ def log_llm_response(
                 logger.debug(f"TOOL CALL: {block.name}")
                 if hasattr(block, 'input'):
                     try:
-                        input_str = json.dumps(block.input, indent=2)
+                        input_str = json.dumps(block.input)
                         logger.debug(f"TOOL INPUT:\n{input_str[:1000]}{'...[truncated]' if len(input_str) > 1000 else ''}")
                     except Exception:
                         logger.debug(f"TOOL INPUT: {block.input}")
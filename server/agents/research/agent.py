@@ -10,6 +10,8 @@ See docs/agent-architecture.md for the architectural specification.
 from __future__ import annotations
 
 from typing import AsyncGenerator, Optional, Callable, Any, Awaitable
+import json
+import re
 import uuid
 
 from claude_agent_sdk import (
@@ -23,6 +25,7 @@ from claude_agent_sdk import (
     create_sdk_mcp_server,
 )
 
+from server.agents.circuit_breaker import sdk_breaker
 from server.persistence import (
     JourneyDesignBrief,
     Session,
@@ -254,19 +257,17 @@ class ResearchAgent(BaseForgeAgent[ResearchPhase, ResearchPhaseContext]):
             if isinstance(sources_raw, list):
                 sources_list = sources_raw
             elif isinstance(sources_raw, str):
-                import json
                 try:
                     sources_list = json.loads(sources_raw) if sources_raw.strip() else []
                 except:
                     sources_list = []
 
             # Find and update the question
-            for q in agent.phase_context.questions:
-                if q.id == question_id:
-                    q.status = "answered"
-                    q.answer = args["answer"]
-                    q.sources = [Source(**s) for s in sources_list]
-                    break
+            q = agent.phase_context.get_question(question_id)
+            if q is not None:
+                q.status = "answered"
+                q.answer = args["answer"]
+                q.sources = [Source(**s) for s in sources_list]
 
             agent.phase_context.mark_question_answered(question_id)
 
@@ -290,7 +291,7 @@ class ResearchAgent(BaseForgeAgent[ResearchPhase, ResearchPhaseContext]):
         )
         async def skip_question(args: dict[str, Any]) -> dict[str, Any]:
             """Skip a question."""
-            agent.phase_context.skipped_question_ids.add(args["question_id"])
+            agent.phase_context.skip_question(args["question_id"])
 
             agent.emitter.emit_sync(SSEEvent(
                 type="data.question.updated",
@@ -322,10 +323,10 @@ class ResearchAgent(BaseForgeAgent[ResearchPhase, ResearchPhaseContext]):
         )
         async def mark_answer_complete(args: dict[str, Any]) -> dict[str, Any]:
             """Signal answer phase is complete."""
-            unanswered = agent.phase_context.get_unanswered_questions()
-            if len(unanswered) == 0:
+            remaining = agent.phase_context.unanswered_count
+            if remaining == 0:
                 agent.phase_context.high_priority_complete = True
-            return {"content": [{"type": "text", "text": f"Answer phase complete. Remaining: {len(unanswered)} questions"}]}
+            return {"content": [{"type": "text", "text": f"Answer phase complete. Remaining: {remaining} questions"}]}
 
         @tool(
             "emit_category_insight",
@@ -384,7 +385,6 @@ class ResearchAgent(BaseForgeAgent[ResearchPhase, ResearchPhaseContext]):
                 question_ids = raw_ids
             else:
                 # Parse comma-separated or newline-separated IDs
-                import re
                 question_ids = [qid.strip() for qid in re.split(r'[,\n]', raw_ids) if qid.strip()]
 
             agent.phase_context.unanswered_for_synthesis = question_ids
@@ -510,23 +510,35 @@ class ResearchAgent(BaseForgeAgent[ResearchPhase, ResearchPhaseContext]):
         )
 
         # Run the agent
-        async with ClaudeSDKClient(options=options) as client:
-            await client.query(prompt)
-
-            async for message in client.receive_response():
-                if isinstance(message, AssistantMessage):
-                    for block in message.content:
-                        if isinstance(block, TextBlock):
-                            # Stream text to frontend
-                            yield agent_speaking(block.text)
-                        elif isinstance(block, ToolUseBlock):
-                            # Tool calls are handled by the SDK
-                            # Our MCP tools emit SSE events internally
-                            pass
-
-                elif isinstance(message, ResultMessage):
-                    # Phase complete
-                    break
+        upstream_error = False
+        sdk_breaker.check()
+        try:
+            async with ClaudeSDKClient(options=options) as client:
+                await client.query(prompt)
+
+                async for message in client.receive_response():
+                    if isinstance(message, AssistantMessage):
+                        for block in message.content:
+                            if isinstance(block, TextBlock):
+                                # Stream text to frontend
+                                yield agent_speaking(block.text)
+                            elif isinstance(block, ToolUseBlock):
+                                # Tool calls are handled by the SDK
+                                # Our MCP tools emit SSE events internally
+                                pass
+
+                    elif isinstance(message, ResultMessage):
+                        # Phase complete (API failures are reported here)
+                        upstream_error = message.is_error
+                        break
+        except Exception:
+            sdk_breaker.record_failure()
+            raise
+
+        if upstream_error:
+            sdk_breaker.record_failure()
+        else:
+            sdk_breaker.record_success()
 
         # Handle checkpoint if needed
         # Skip checkpoints when awaiting user input - the user hasn't responded yet
@@ -674,8 +686,8 @@ class ResearchAgent(BaseForgeAgent[ResearchPhase, ResearchPhaseContext]):
             return f"I've generated {num_categories} categories with {num_questions} questions. Would you like to proceed, or adjust the question tree?"
 
         elif phase == ResearchPhase.ANSWER:
-            unanswered = self.phase_context.get_unanswered_questions()
-            return f"I have {len(unanswered)} questions remaining to answer. Should I continue researching?"
+            remaining = self.phase_context.unanswered_count
+            return f"I have {remaining} questions remaining to answer. Should I continue researching?"
 
         return "I'm waiting for your response to continue."
 
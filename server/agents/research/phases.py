@@ -133,6 +133,12 @@ class ResearchPhaseContext(BasePhaseContext):
     new_category_pending: Optional[str] = None  # Category name to add
     unanswered_for_synthesis: list[str] = field(default_factory=list)  # Question IDs
 
+    # Derived indexes (rebuilt by from_dict, never persisted)
+    _questions_by_id: dict[str, Question] = field(
+        default_factory=dict, init=False, repr=False, compare=False
+    )
+    _unanswered_count: int = field(default=0, init=False, repr=False, compare=False)
+
     def add_category(self, category: CategoryQuestion) -> None:
         """Add a category to the context."""
         self.categories.append(category)
@@ -140,11 +146,54 @@ class ResearchPhaseContext(BasePhaseContext):
     def add_question(self, question: Question) -> None:
         """Add a question to the context."""
         self.questions.append(question)
+        self._index_question(question)
+
+    def _index_question(self, question: Question) -> None:
+        """Track a question in the id index and the open-question counter."""
+        if question.id in self._questions_by_id:
+            return
+        self._questions_by_id[question.id] = question
+        if self._is_open(question.id):
+            self._unanswered_count += 1
+
+    def _reindex_questions(self) -> None:
+        """Rebuild derived indexes from the question list."""
+        self._questions_by_id = {}
+        self._unanswered_count = 0
+        for question in self.questions:
+            self._index_question(question)
+
+    def _is_open(self, question_id: str) -> bool:
+        """Check if a question is neither answered nor skipped."""
+        return (
+            question_id not in self.answered_question_ids
+            and question_id not in self.skipped_question_ids
+        )
+
+    def _close_question(self, question_id: str) -> None:
+        """Decrement the open-question counter if the question was still open."""
+        if question_id in self._questions_by_id and self._is_open(question_id):
+            self._unanswered_count -= 1
+
+    def get_question(self, question_id: str) -> Optional[Question]:
+        """Get a question by ID."""
+        return self._questions_by_id.get(question_id)
 
     def mark_question_answered(self, question_id: str) -> None:
         """Mark a question as answered."""
+        self._close_question(question_id)
         self.answered_question_ids.add(question_id)
 
+    def skip_question(self, question_id: str) -> None:
+        """Mark a question as skipped."""
+        self._close_question(question_id)
+        self.skipped_question_ids.add(question_id)
+
+    @property
+    def unanswered_count(self) -> int:
+        """Number of questions neither answered nor skipped."""
+        return self._unanswered_count
+
     def get_unanswered_questions(self) -> list[Question]:
         """Get all unanswered questions."""
         return [
@@ -215,4 +264,5 @@ class ResearchPhaseContext(BasePhaseContext):
             AdjacentQuestion(**aq) for aq in data.get("adjacent_questions", [])
         ]
         ctx.frontier_populated = data.get("frontier_populated", False)
+        ctx._reindex_questions()
         return ctx
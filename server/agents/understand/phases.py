@@ -96,7 +96,22 @@ UNDERSTAND_TRANSITIONS: list[PhaseTransition] = [
 # Phase Context
 # =============================================================================
 
-@dataclass
+# Calibration probes run for every SLO, in order
+_ALL_PROBES: tuple[str, ...] = ("feynman", "minimal_example", "boundary")
+
+# Knowledge facets tracked for every SLO
+_FACETS: tuple[str, ...] = (
+    "vocabulary", "mental_model", "practical_grasp", "boundary_conditions", "transfer",
+)
+
+# Facets that need their own minimum rounds before mastery (transfer is
+# covered by transfer_passes instead)
+_REQUIRED_FACETS: tuple[str, ...] = (
+    "vocabulary", "mental_model", "practical_grasp", "boundary_conditions",
+)
+
+
+@dataclass(slots=True)
 class UnderstandPhaseContext(BasePhaseContext):
     """
     Context for the Understand agent that persists across phases.
@@ -145,6 +160,14 @@ class UnderstandPhaseContext(BasePhaseContext):
     completed_slo_ids: list[str] = field(default_factory=list)
     skipped_slo_ids: list[str] = field(default_factory=list)
 
+    # Derived caches (never persisted)
+    _slo_by_id: dict[str, SLO] = field(
+        default_factory=dict, init=False, repr=False, compare=False
+    )
+    _slo_dumps: dict[str, dict] = field(
+        default_factory=dict, init=False, repr=False, compare=False
+    )
+
     # ==========================================================================
     # SLO Management
     # ==========================================================================
@@ -152,36 +175,63 @@ class UnderstandPhaseContext(BasePhaseContext):
     def add_slo(self, slo: SLO) -> None:
         """Add an SLO to the list."""
         self.slos.append(slo)
+        self._slo_by_id.setdefault(slo.id, slo)
+        self._slo_dumps.pop(slo.id, None)
         # Initialize counters for this SLO
         self.slo_counters[slo.id] = {
             "total_rounds": 0,
             "consecutive_passes": 0,
             "transfer_passes": 0,
-            "facet_rounds": {
-                "vocabulary": 0,
-                "mental_model": 0,
-                "practical_grasp": 0,
-                "boundary_conditions": 0,
-                "transfer": 0,
-            },
+            "facet_rounds": dict.fromkeys(_FACETS, 0),
         }
-        # Initialize knowledge state for this SLO
+        # Initialize knowledge state for this SLO (constant, known-valid
+        # values, so skip validation)
         self.knowledge_states[slo.id] = {
-            "vocabulary": KnowledgeStateFacet(facet="vocabulary", status="not_tested"),
-            "mental_model": KnowledgeStateFacet(facet="mental_model", status="not_tested"),
-            "practical_grasp": KnowledgeStateFacet(facet="practical_grasp", status="not_tested"),
-            "boundary_conditions": KnowledgeStateFacet(facet="boundary_conditions", status="not_tested"),
-            "transfer": KnowledgeStateFacet(facet="transfer", status="not_tested"),
+            facet: KnowledgeStateFacet.model_construct(facet=facet, status="not_tested")
+            for facet in _FACETS
         }
 
+    def _reindex_slos(self) -> None:
+        """Rebuild the SLO id index from the SLO list."""
+        self._slo_by_id = {}
+        for slo in self.slos:
+            self._slo_by_id.setdefault(slo.id, slo)
+
+    def get_slo(self, slo_id: Optional[str]) -> Optional[SLO]:
+        """Get an SLO by ID."""
+        return self._slo_by_id.get(slo_id)
+
+    def next_slo_id(self) -> str:
+        """Get a session-scoped ID for the next SLO (SLOs are never removed)."""
+        return f"slo-{len(self.slos) + 1}"
+
+    def get_slo_dump(self, slo: SLO) -> dict:
+        """
+        Get the aliased, JSON-ready dump of an SLO.
+
+        Cached per SLO id: SLOs are not mutated after add_slo, so callers
+        must treat the returned dict as read-only.
+        """
+        dump = self._slo_dumps.get(slo.id)
+        if dump is None:
+            dump = self._slo_dumps[slo.id] = slo.model_dump(by_alias=True, mode="json")
+        return dump
+
+    def get_slo_ids(self) -> list[str]:
+        """Get the IDs of all SLOs, in the order they were added."""
+        return [s.id for s in self.slos]
+
+    def get_slo_dumps(self) -> list[dict]:
+        """Get the cached aliased dumps of all SLOs."""
+        return [self.get_slo_dump(s) for s in self.slos]
+
     def get_current_slo(self) -> Optional[SLO]:
         """Get the currently active SLO."""
         if not self.selected_slo_ids:
             return None
         if self.current_slo_index >= len(self.selected_slo_ids):
             return None
-        slo_id = self.selected_slo_ids[self.current_slo_index]
-        return next((s for s in self.slos if s.id == slo_id), None)
+        return self.get_slo(self.selected_slo_ids[self.current_slo_index])
 
     def get_current_counters(self) -> Optional[dict]:
         """Get counters for current SLO."""
@@ -207,13 +257,13 @@ class UnderstandPhaseContext(BasePhaseContext):
 
     def get_remaining_probes(self) -> list[str]:
         """Get list of probes not yet completed for current SLO."""
-        all_probes = ["feynman", "minimal_example", "boundary"]
-        completed = set(self.get_current_probe_results().keys())
-        return [p for p in all_probes if p not in completed]
+        results = self.get_current_probe_results()
+        return [p for p in _ALL_PROBES if p not in results]
 
     def is_calibration_probes_complete(self) -> bool:
         """Check if all calibration probes are done for current SLO."""
-        return len(self.get_remaining_probes()) == 0
+        results = self.get_current_probe_results()
+        return all(p in results for p in _ALL_PROBES)
 
     def get_current_knowledge_state(self) -> Optional[dict[str, KnowledgeStateFacet]]:
         """Get knowledge state for current SLO."""
@@ -222,6 +272,15 @@ class UnderstandPhaseContext(BasePhaseContext):
             return self.knowledge_states.get(slo.id)
         return None
 
+    def get_current_snapshot(
+        self,
+    ) -> tuple[Optional[SLO], Optional[dict], Optional[dict[str, KnowledgeStateFacet]]]:
+        """Get the current SLO with its counters and knowledge state in one lookup."""
+        slo = self.get_current_slo()
+        if not slo:
+            return None, None, None
+        return slo, self.slo_counters.get(slo.id), self.knowledge_states.get(slo.id)
+
     def increment_round(self, facet: str) -> None:
         """Increment round counter for current SLO."""
         counters = self.get_current_counters()
@@ -267,34 +326,34 @@ class UnderstandPhaseContext(BasePhaseContext):
         if not counters or not state:
             return False
 
-        # Minimum 7 rounds
-        if counters["total_rounds"] < 7:
+        # Minimum 7 rounds, 3+ consecutive passes, 2+ transfer passes
+        if (
+            counters["total_rounds"] < 7
+            or counters["consecutive_passes"] < 3
+            or counters["transfer_passes"] < 2
+        ):
             return False
 
         # At least 2 rounds per facet (excluding transfer)
-        for facet in ["vocabulary", "mental_model", "practical_grasp", "boundary_conditions"]:
-            if counters["facet_rounds"].get(facet, 0) < 2:
-                return False
-
-        # 3+ consecutive passes
-        if counters["consecutive_passes"] < 3:
-            return False
-
-        # 2+ transfer passes
-        if counters["transfer_passes"] < 2:
+        facet_rounds = counters["facet_rounds"]
+        if any(facet_rounds.get(facet, 0) < 2 for facet in _REQUIRED_FACETS):
             return False
 
         # No facet is "missing"
-        for facet_state in state.values():
-            if facet_state.status == "missing":
-                return False
+        return not any(s.status == "missing" for s in state.values())
+
+    def _get_done_slo_ids(self) -> set[str]:
+        """
+        Get the IDs of completed and skipped SLOs.
 
-        return True
+        Built per call: the ID lists are public and assigned directly.
+        """
+        return {*self.completed_slo_ids, *self.skipped_slo_ids}
 
     def has_next_slo(self) -> bool:
         """Check if there's another SLO to work on."""
-        remaining = set(self.selected_slo_ids) - set(self.completed_slo_ids) - set(self.skipped_slo_ids)
-        return len(remaining) > 0
+        done = self._get_done_slo_ids()
+        return any(slo_id not in done for slo_id in self.selected_slo_ids)
 
     def advance_to_next_slo(self) -> bool:
         """Move to the next SLO. Returns True if successful."""
@@ -304,8 +363,9 @@ class UnderstandPhaseContext(BasePhaseContext):
             self.completed_slo_ids.append(current.id)
 
         # Find next uncompleted SLO
+        done = self._get_done_slo_ids()
         for i, slo_id in enumerate(self.selected_slo_ids):
-            if slo_id not in self.completed_slo_ids and slo_id not in self.skipped_slo_ids:
+            if slo_id not in done:
                 self.current_slo_index = i
                 self.current_slo_calibrated = False
                 return True
@@ -341,7 +401,7 @@ class UnderstandPhaseContext(BasePhaseContext):
             "session_configured": self.session_configured,
             # Stage 1
             "topic_type": self.topic_type,
-            "slos": [s.model_dump(by_alias=True) for s in self.slos],
+            "slos": self.get_slo_dumps(),
             "selected_slo_ids": self.selected_slo_ids,
             "slos_presented": self.slos_presented,
             "slos_confirmed": self.slos_confirmed,
@@ -399,4 +459,5 @@ class UnderstandPhaseContext(BasePhaseContext):
         }
         ctx.completed_slo_ids = data.get("completed_slo_ids", [])
         ctx.skipped_slo_ids = data.get("skipped_slo_ids", [])
+        ctx._reindex_slos()
         return ctx
@@ -156,6 +156,8 @@ For each SLO, use the emit_slo tool with:
 - sample_transfer_check: One question that would verify mastery
 - estimated_rounds: 2-4 for atomic aspects, 4-7 for complex
 
+Make all emit_slo calls together in a single response (one call per SLO, side by side) rather than one SLO per turn.
+
 **CRITICAL**: After generating and presenting SLOs:
 1. Call mark_slos_presented to record that you've shown them
 2. STOP and WAIT for the learner to select which SLOs they want
@@ -234,9 +236,8 @@ Evaluation Rubric:
 
 When the learner's response is included below:
 1. Evaluate their response using the rubric
-2. Call record_probe_result with probe_type, result, and reasoning
-3. Call update_facet_status with the appropriate facet
-4. Then ask the NEXT probe (and call mark_probe_question_asked again, then STOP)
+2. Call record_probe_result (probe_type, result, reasoning) and update_facet_status (the appropriate facet) together in the same response
+3. Then ask the NEXT probe (and call mark_probe_question_asked again, then STOP)
 
 After all three probes are done, use mark_calibration_complete to proceed to the Diagnostic phase.
 
@@ -262,13 +263,12 @@ The probe descriptions are:
 
 If the learner's response is included below:
 1. Evaluate their response using the rubric (STRONG/PARTIAL/WEAK/MISSING)
-2. Call record_probe_result with probe_type, result, and reasoning
-3. Call update_facet_status with the appropriate facet
-4. If more probes remain:
+2. Call record_probe_result (probe_type, result, reasoning) and update_facet_status (the appropriate facet) together in the same response
+3. If more probes remain:
    - Ask the NEXT probe question
    - Call mark_probe_question_asked
    - STOP - generate no more text
-5. When all probes done, call mark_calibration_complete"""
+4. When all probes done, call mark_calibration_complete"""
 
 
 CALIBRATE_REENTRY_PROMPT = """Resuming Triple Calibration for the next SLO.
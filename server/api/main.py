@@ -5,10 +5,11 @@ FastAPI application for Knowledge Forge backend.
 from __future__ import annotations
 
 import asyncio
+import json
 import signal
 import sys
 from contextlib import asynccontextmanager
-from fastapi import FastAPI
+from fastapi import FastAPI, Response
 from fastapi.middleware.cors import CORSMiddleware
 
 from .routes import journey, chat, session
@@ -33,9 +34,11 @@ async def lifespan(app: FastAPI):
 
     Solution:
     - Register signal handlers via loop.add_signal_handler() during startup
+      (SIGINT, SIGTERM and, where available, SIGHUP for container reloads)
     - These handlers run IMMEDIATELY when SIGINT arrives (before uvicorn's wait)
+    - Handler removes itself first, so a second Ctrl-C force-quits
     - Handler closes all SSE streams (puts None in queues to unblock generators)
-    - Handler schedules a clean exit after a brief delay for streams to close
+    - Handler schedules a clean exit once the streams have drained (or 0.5s)
     - Uses sys.exit(0) instead of re-raising SIGINT to avoid traceback noise
 
     Why other approaches failed:
@@ -45,37 +48,39 @@ async def lifespan(app: FastAPI):
     - os.kill(SIGINT): works but produces ugly CancelledError tracebacks
     """
     loop = asyncio.get_running_loop()
-    shutdown_triggered = False
+    shutdown_signals = [signal.SIGINT, signal.SIGTERM]
+    if hasattr(signal, "SIGHUP"):
+        shutdown_signals.append(signal.SIGHUP)
 
     def handle_shutdown_signal():
-        """Close all SSE streams immediately on SIGINT/SIGTERM."""
-        nonlocal shutdown_triggered
-        if shutdown_triggered:
-            return  # Prevent re-entry
-        shutdown_triggered = True
-
+        """Close all SSE streams immediately on a shutdown signal."""
         print("\n[shutdown] Closing all SSE streams...")
-        stream_manager.close_all_streams()
+        # Remove our handlers first: a repeated signal gets the default
+        # behaviour (force quit) instead of re-entering this handler
+        for sig in shutdown_signals:
+            loop.remove_signal_handler(sig)
 
-        # Remove our handlers
-        loop.remove_signal_handler(signal.SIGINT)
-        loop.remove_signal_handler(signal.SIGTERM)
+        stream_manager.close_all_streams()
 
-        # Schedule clean exit after brief delay for streams to close
+        # Schedule clean exit once the streams have finished closing
         # Using sys.exit avoids the CancelledError tracebacks from os.kill(SIGINT)
         async def delayed_exit():
-            await asyncio.sleep(0.1)  # Let streams finish closing
+            await stream_manager.wait_all_closed(timeout=0.5)
             print("[shutdown] Exiting...")
             sys.exit(0)
 
         asyncio.create_task(delayed_exit())
 
     # Register signal handlers that run in the event loop
-    loop.add_signal_handler(signal.SIGINT, handle_shutdown_signal)
-    loop.add_signal_handler(signal.SIGTERM, handle_shutdown_signal)
+    for sig in shutdown_signals:
+        loop.add_signal_handler(sig, handle_shutdown_signal)
+
+    # Chat messages are processed by a fixed pool of workers
+    chat.start_chat_workers()
 
     yield
 
+    await chat.stop_chat_workers()
     # Shutdown complete (handlers already removed in signal handler)
 
 # =============================================================================
@@ -122,18 +127,23 @@ app.include_router(session.router, prefix="/api/sessions", tags=["session"], inc
 # Health Check
 # =============================================================================
 
+# Static bodies, encoded once (these endpoints are polled by probes)
+_HEALTH_BODY = json.dumps({"status": "healthy", "service": "knowledge-forge-api"}).encode()
+_ROOT_BODY = json.dumps({
+    "name": "Knowledge Forge API",
+    "version": "0.1.0",
+    "docs": "/docs",
+    "health": "/health",
+}).encode()
+
+
 @app.get("/health")
 async def health_check():
     """Health check endpoint."""
-    return {"status": "healthy", "service": "knowledge-forge-api"}
+    return Response(_HEALTH_BODY, media_type="application/json")
 
 
 @app.get("/")
 async def root():
     """Root endpoint with API info."""
-    return {
-        "name": "Knowledge Forge API",
-        "version": "0.1.0",
-        "docs": "/docs",
-        "health": "/health",
-    }
+    return Response(_ROOT_BODY, media_type="application/json")
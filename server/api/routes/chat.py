@@ -7,12 +7,16 @@ Endpoints:
 
 from __future__ import annotations
 
+import asyncio
 import logging
+import os
+from collections import deque
 from typing import Optional
 from fastapi import APIRouter, HTTPException, BackgroundTasks
 from pydantic import BaseModel, Field
 
-from server.persistence import SessionStore, SessionNotFoundError
+from server import agents
+from server.persistence import SessionNotFoundError, get_session_store
 from ..streaming import (
     stream_manager,
     agent_thinking,
@@ -31,7 +35,7 @@ logger = logging.getLogger(__name__)
 router = APIRouter()
 
 # Session store instance
-store = SessionStore()
+store = get_session_store()
 
 
 # =============================================================================
@@ -76,19 +80,18 @@ async def process_chat_message(
     This routes to the appropriate mode agent (Research, Understand, Build)
     and streams SSE events back to the client.
     """
-    print(f"[DEBUG] process_chat_message started: session_id={session_id}")
-
-    # Import here to avoid circular imports
-    from server.agents import get_or_create_agent, save_agent_state
+    logger.debug("process_chat_message started: session_id=%s", session_id)
 
     try:
         # Get session
         session = store.get(session_id)
-        print(f"[DEBUG] Session loaded: mode={session.mode}, has_brief={session.journey_brief is not None}")
+        logger.debug(
+            "Session loaded: mode=%s, has_brief=%s",
+            session.mode, session.journey_brief is not None,
+        )
 
         # Validate we have a journey brief
         if not session.journey_brief:
-            print(f"[DEBUG] No journey brief found!")
             await stream_manager.emit(
                 session_id,
                 error_event(
@@ -100,22 +103,19 @@ async def process_chat_message(
 
         # Create emit callback for the agent
         async def emit_event(event):
-            print(f"[DEBUG] Emitting SSE event: type={event.type}")
             await stream_manager.emit(session_id, event)
 
         # Emit initial thinking event
-        print(f"[DEBUG] Emitting initial agent.thinking event")
         await emit_event(agent_thinking(f"Processing in {session.mode} mode..."))
 
         # Get or create the appropriate agent
-        print(f"[DEBUG] Getting or creating agent for mode: {session.mode}")
-        agent = await get_or_create_agent(
+        agent = await agents.get_or_create_agent(
             session=session,
             journey_brief=session.journey_brief,
             emit_event=emit_event,
             checkpoint_handler=None,  # TODO: Add checkpoint support
         )
-        print(f"[DEBUG] Agent created/retrieved: {type(agent).__name__}")
+        logger.debug("Agent ready: %s", type(agent).__name__)
 
         # Convert context to dict if provided
         ctx = {}
@@ -126,17 +126,14 @@ async def process_chat_message(
                 ctx["active_tab"] = context.active_tab
 
         # Process message through agent
-        print(f"[DEBUG] Starting agent.process_message...")
         try:
             event_count = 0
             async for event in agent.process_message(message, ctx):
                 event_count += 1
-                print(f"[DEBUG] Agent yielded event #{event_count}: type={event.type}")
                 await emit_event(event)
-            print(f"[DEBUG] Agent finished processing, total events: {event_count}")
+            logger.debug("Agent finished processing, total events: %d", event_count)
         except Exception as agent_error:
-            print(f"[DEBUG] Agent error: {agent_error}")
-            logger.exception(f"Agent error processing message: {agent_error}")
+            logger.exception("Agent error processing message: %s", agent_error)
             await emit_event(
                 error_event(
                     f"Agent error: {str(agent_error)}",
@@ -146,32 +143,127 @@ async def process_chat_message(
             return
 
         # Save agent state back to session
-        print(f"[DEBUG] Saving agent state")
-        save_agent_state(session, agent)
+        agents.save_agent_state(session, agent)
 
-        # Update session timestamp and save
-        from datetime import datetime
-        session.updated = datetime.utcnow()
+        # Save (store.save stamps session.updated)
         store.save(session)
 
-        print(f"[DEBUG] Message processing complete for session {session_id}")
-        logger.info(f"Processed message for session {session_id} in {session.mode} mode")
+        logger.info("Processed message for session %s in %s mode", session_id, session.mode)
 
     except SessionNotFoundError:
-        print(f"[DEBUG] SessionNotFoundError for {session_id}")
         await stream_manager.emit(
             session_id,
             error_event("Session not found", code="SESSION_NOT_FOUND"),
         )
     except Exception as e:
-        print(f"[DEBUG] Exception in process_chat_message: {e}")
-        logger.exception(f"Error processing chat message: {e}")
+        logger.exception("Error processing chat message: %s", e)
         await stream_manager.emit(
             session_id,
             error_event(f"Error processing message: {str(e)}", code="PROCESSING_ERROR"),
         )
 
 
+# =============================================================================
+# Worker Pool
+# =============================================================================
+
+# Concurrent agent runs. Runs are I/O-bound LLM calls, so the bound is high
+# enough that users don't wait on each other; it only caps how many SDK
+# clients run at once. Override with the CHAT_WORKER_COUNT env var.
+CHAT_WORKER_COUNT = int(os.environ.get("CHAT_WORKER_COUNT", "64"))
+# Messages waiting (not yet running) before the route answers 503
+CHAT_QUEUE_SIZE = int(os.environ.get("CHAT_QUEUE_SIZE", "256"))
+# Seconds to let in-flight runs finish at shutdown before cancelling them
+CHAT_SHUTDOWN_TIMEOUT = 0.5
+
+# Waiting messages per session. A session is listed while it has messages
+# waiting or running, and is on the ready queue at most once, so its
+# messages run one at a time and in order.
+_session_pending: dict[str, deque] = {}
+_pending_count = 0
+# Sessions with a message ready to run; any idle worker takes the next one
+_ready_sessions: Optional[asyncio.Queue] = None
+_chat_workers: list[asyncio.Task] = []
+
+
+async def _chat_worker(ready: asyncio.Queue) -> None:
+    """Run the next message of each ready session, one message at a time."""
+    global _pending_count
+    while True:
+        session_id = await ready.get()
+        try:
+            pending = _session_pending[session_id]
+            message, context = pending.popleft()
+            _pending_count -= 1
+            try:
+                await process_chat_message(session_id, message, context)
+            except Exception:
+                # Keep the worker alive for the rest of the queue
+                logger.exception("Chat worker failed processing a message")
+            if pending:
+                # Back of the line, so a busy session can't hold this worker
+                ready.put_nowait(session_id)
+            else:
+                del _session_pending[session_id]
+        finally:
+            ready.task_done()
+
+
+def start_chat_workers(count: int = CHAT_WORKER_COUNT) -> None:
+    """Start the chat worker pool (called from the app lifespan)."""
+    global _ready_sessions
+    if _chat_workers:
+        return
+    _ready_sessions = asyncio.Queue()
+    for _ in range(count):
+        _chat_workers.append(asyncio.create_task(_chat_worker(_ready_sessions)))
+
+
+def enqueue_chat_message(
+    session_id: str,
+    message: str,
+    context: Optional[ChatContext],
+) -> bool:
+    """
+    Queue a message for the worker pool.
+
+    Returns False if the pool isn't running. Raises asyncio.QueueFull
+    if CHAT_QUEUE_SIZE messages are already waiting.
+    """
+    global _pending_count
+    if _ready_sessions is None:
+        return False
+    if _pending_count >= CHAT_QUEUE_SIZE:
+        raise asyncio.QueueFull
+    pending = _session_pending.get(session_id)
+    if pending is None:
+        pending = _session_pending[session_id] = deque()
+        _ready_sessions.put_nowait(session_id)
+    pending.append((message, context))
+    _pending_count += 1
+    return True
+
+
+async def stop_chat_workers(timeout: float = CHAT_SHUTDOWN_TIMEOUT) -> None:
+    """Give queued messages up to `timeout` seconds, then cancel the pool."""
+    global _ready_sessions, _pending_count
+    if _ready_sessions is None:
+        return
+    try:
+        await asyncio.wait_for(_ready_sessions.join(), timeout)
+    except asyncio.TimeoutError:
+        logger.warning(
+            "Cancelling chat workers with %d messages still waiting", _pending_count
+        )
+    for worker in _chat_workers:
+        worker.cancel()
+    await asyncio.gather(*_chat_workers, return_exceptions=True)
+    _chat_workers.clear()
+    _session_pending.clear()
+    _pending_count = 0
+    _ready_sessions = None
+
+
 # =============================================================================
 # Routes
 # =============================================================================
@@ -188,33 +280,37 @@ async def send_chat_message(
     Results are streamed via the /api/journey/stream SSE endpoint.
 
     Returns 202 Accepted immediately, actual results via SSE.
+    Returns 503 if too many messages are already waiting.
     """
-    print(f"[DEBUG] POST /api/chat received: session_id={request.session_id}, message={request.message[:50]}...")
+    logger.debug("POST /api/chat received: session_id=%s", request.session_id)
 
     # Validate session exists
     if not store.exists(request.session_id):
-        print(f"[DEBUG] Session not found: {request.session_id}")
         raise HTTPException(status_code=404, detail="Session not found")
 
     # Validate message
     if not request.message.strip():
-        print(f"[DEBUG] Empty message rejected")
         raise HTTPException(status_code=400, detail="Message cannot be empty")
 
     # Ensure stream exists for this session
-    if not stream_manager.has_stream(request.session_id):
-        print(f"[DEBUG] Creating stream for session: {request.session_id}")
-        stream_manager.create_stream(request.session_id)
-
-    print(f"[DEBUG] Queueing background task for message processing")
+    stream_manager.get_or_create_stream(request.session_id)
 
     # Process message in background
-    background_tasks.add_task(
-        process_chat_message,
-        request.session_id,
-        request.message,
-        request.context,
-    )
+    try:
+        queued = enqueue_chat_message(request.session_id, request.message, request.context)
+    except asyncio.QueueFull:
+        raise HTTPException(
+            status_code=503,
+            detail="Too many messages in progress, try again shortly",
+        )
+    if not queued:
+        # No worker pool outside the app lifespan (e.g. a bare TestClient)
+        background_tasks.add_task(
+            process_chat_message,
+            request.session_id,
+            request.message,
+            request.context,
+        )
 
     return ChatResponse(
         accepted=True,
@@ -15,9 +15,9 @@ from fastapi.responses import StreamingResponse
 from pydantic import BaseModel, Field
 
 from server.persistence import (
-    SessionStore,
     JourneyDesignBrief,
     Mode,
+    get_session_store,
 )
 from server.orchestrator import Orchestrator
 from ..streaming import stream_manager, session_started
@@ -30,7 +30,7 @@ from ..streaming import stream_manager, session_started
 router = APIRouter()
 
 # Session store instance (shared across routes)
-store = SessionStore()
+store = get_session_store()
 
 # Orchestrator instance
 orchestrator = Orchestrator(store=store, stream_manager=stream_manager)
@@ -136,8 +136,7 @@ async def stream_journey(session_id: str = Query(..., alias="sessionId", descrip
         raise HTTPException(status_code=404, detail="Session not found")
 
     # Ensure stream exists
-    if not orchestrator.has_stream(session_id):
-        orchestrator.create_stream(session_id)
+    orchestrator.create_stream(session_id)
 
     async def event_generator():
         # Send initial session started event
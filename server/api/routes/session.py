@@ -11,15 +11,15 @@ Endpoints:
 from __future__ import annotations
 
 from typing import Optional
-from fastapi import APIRouter, HTTPException
+from fastapi import APIRouter, HTTPException, Response
 from pydantic import BaseModel
 
 from server.persistence import (
-    SessionStore,
     SessionNotFoundError,
     Session,
     Mode,
     BuildPhase,
+    get_session_store,
 )
 
 
@@ -30,7 +30,7 @@ from server.persistence import (
 router = APIRouter()
 
 # Session store instance
-store = SessionStore()
+store = get_session_store()
 
 
 # =============================================================================
@@ -108,7 +108,9 @@ async def get_session(session_id: str):
     """
     try:
         session = store.get(session_id)
-        return session.model_dump(mode="json")
+        # Serialize straight to JSON; a dict return would be walked again
+        # by jsonable_encoder before encoding
+        return Response(session.model_dump_json(), media_type="application/json")
     except SessionNotFoundError:
         raise HTTPException(status_code=404, detail="Session not found")
 
@@ -58,7 +58,12 @@ SSEEventType = Literal[
 # SSE Event Model
 # =============================================================================
 
-@dataclass
+# Compact separators keep frames small; the encoder is built once instead of
+# per json.dumps call with non-default arguments.
+_encode_json = json.JSONEncoder(separators=(",", ":")).encode
+
+
+@dataclass(slots=True)
 class SSEEvent:
     """
     A Server-Sent Event to be streamed to the client.
@@ -73,7 +78,7 @@ class SSEEvent:
 
     def format(self) -> str:
         """Format as SSE event string."""
-        data = json.dumps({
+        data = _encode_json({
             "type": self.type,
             "timestamp": self.timestamp,
             "payload": self.payload,
@@ -174,6 +179,12 @@ def data_event(event_type: SSEEventType, **kwargs) -> SSEEvent:
 # SSE Stream Manager
 # =============================================================================
 
+# Seconds between keepalive comments on an open stream
+KEEPALIVE_INTERVAL = 30.0
+
+# Queued by the keepalive task; None is reserved for "stream closed"
+_KEEPALIVE = object()
+
 class SSEStreamManager:
     """
     Manages SSE event streams for active sessions.
@@ -184,11 +195,21 @@ class SSEStreamManager:
 
     def __init__(self):
         self._queues: dict[str, asyncio.Queue[SSEEvent | None]] = {}
+        # Set whenever no subscriber generator is running
+        self._subscribers = 0
+        self._all_closed = asyncio.Event()
+        self._all_closed.set()
+
+    def get_or_create_stream(self, session_id: str) -> asyncio.Queue[SSEEvent | None]:
+        """Return a session's event queue, creating it if needed."""
+        queue = self._queues.get(session_id)
+        if queue is None:
+            queue = self._queues.setdefault(session_id, asyncio.Queue())
+        return queue
 
     def create_stream(self, session_id: str) -> None:
-        """Create a new event queue for a session."""
-        if session_id not in self._queues:
-            self._queues[session_id] = asyncio.Queue()
+        """Create a new event queue for a session (no-op if one exists)."""
+        self.get_or_create_stream(session_id)
 
     def close_stream(self, session_id: str) -> None:
         """Close the stream for a session."""
@@ -203,6 +224,13 @@ class SSEStreamManager:
             self._queues[session_id].put_nowait(None)
         self._queues.clear()
 
+    async def wait_all_closed(self, timeout: float) -> None:
+        """Wait until every subscriber has finished, or `timeout` seconds."""
+        try:
+            await asyncio.wait_for(self._all_closed.wait(), timeout)
+        except asyncio.TimeoutError:
+            pass
+
     async def emit(self, session_id: str, event: SSEEvent) -> None:
         """Emit an event to a session's stream."""
         if session_id in self._queues:
@@ -221,31 +249,54 @@ class SSEStreamManager:
         Subscribe to a session's event stream.
 
         Yields SSE-formatted event strings until the stream is closed.
+        Events already queued together (e.g. a burst of tool events
+        flushed after a phase) are coalesced into a single chunk.
         Handles shutdown gracefully without propagating exceptions.
         """
-        if session_id not in self._queues:
-            self.create_stream(session_id)
-
-        queue = self._queues[session_id]
+        queue = self.get_or_create_stream(session_id)
+        self._subscribers += 1
+        self._all_closed.clear()
+        # Keepalives are queued like events, so the loop below is a plain get()
+        keepalive = asyncio.create_task(self._keepalive_loop(queue))
 
         try:
-            while True:
-                try:
-                    # Use timeout so we can respond to shutdown signals
-                    event = await asyncio.wait_for(queue.get(), timeout=30.0)
-                    if event is None:
-                        # Stream closed (shutdown signal received)
-                        break
-                    yield event.format()
-                except asyncio.TimeoutError:
+            closed = False
+            while not closed:
+                event = await queue.get()
+                if event is None:
+                    # Stream closed (shutdown signal received)
+                    break
+                if event is _KEEPALIVE:
                     # Send keepalive comment to maintain connection
                     yield ": keepalive\n\n"
+                    continue
+                frames = [event.format()]
+                while not queue.empty():
+                    event = queue.get_nowait()
+                    if event is None:
+                        closed = True
+                        break
+                    if event is not _KEEPALIVE:
+                        frames.append(event.format())
+                yield "".join(frames)
         except (asyncio.CancelledError, GeneratorExit):
             # Graceful shutdown - exit silently without propagating
             pass
         except Exception:
             # Suppress any other exceptions during shutdown
             pass
+        finally:
+            keepalive.cancel()
+            self._subscribers -= 1
+            if not self._subscribers:
+                self._all_closed.set()
+
+    @staticmethod
+    async def _keepalive_loop(queue: asyncio.Queue) -> None:
+        """Queue a keepalive marker every KEEPALIVE_INTERVAL seconds."""
+        while True:
+            await asyncio.sleep(KEEPALIVE_INTERVAL)
+            queue.put_nowait(_KEEPALIVE)
 
     def has_stream(self, session_id: str) -> bool:
         """Check if a session has an active stream."""
@@ -19,6 +19,7 @@ from server.persistence import (
     BuildModeData,
     Narrative,
     CategoryQuestion,
+    get_session_store,
 )
 from .router import QuestionRouter
 
@@ -43,7 +44,7 @@ class JourneyDesigner:
             store: Session store for creating sessions
             client: Anthropic client for LLM-powered analysis
         """
-        self.store = store or SessionStore()
+        self.store = store or get_session_store()
         self.router = QuestionRouter(client)
 
     async def analyze_question(
@@ -15,6 +15,7 @@ from server.persistence import (
     Session,
     SessionStore,
     Mode,
+    get_session_store,
 )
 from server.api.streaming import (
     SSEEvent,
@@ -60,7 +61,7 @@ class Orchestrator:
             stream_manager: Manager for SSE event streams
             client: Anthropic client for LLM operations
         """
-        self.store = store or SessionStore()
+        self.store = store or get_session_store()
         self.stream_manager = stream_manager
         self._client = client
 
@@ -312,7 +313,7 @@ class Orchestrator:
     # =========================================================================
 
     def create_stream(self, session_id: str) -> None:
-        """Create an SSE stream for a session."""
+        """Create an SSE stream for a session (no-op if one exists)."""
         if self.stream_manager:
             self.stream_manager.create_stream(session_id)
 
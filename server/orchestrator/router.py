@@ -63,6 +63,11 @@ RESEARCH_PATTERNS = [
     r"\bwhat approaches\b",
 ]
 
+# Each mode's patterns as one alternation, so a question is scanned once per mode
+_BUILD_RE = re.compile("|".join(BUILD_PATTERNS))
+_UNDERSTAND_RE = re.compile("|".join(UNDERSTAND_PATTERNS))
+_RESEARCH_RE = re.compile("|".join(RESEARCH_PATTERNS))
+
 
 # =============================================================================
 # Question Router
@@ -102,19 +107,16 @@ class QuestionRouter:
         question_lower = question.lower()
 
         # Check build patterns first (most specific)
-        for pattern in BUILD_PATTERNS:
-            if re.search(pattern, question_lower):
-                return ("build", "skill")
+        if _BUILD_RE.search(question_lower):
+            return ("build", "skill")
 
         # Check understand patterns
-        for pattern in UNDERSTAND_PATTERNS:
-            if re.search(pattern, question_lower):
-                return ("understand", "understanding")
+        if _UNDERSTAND_RE.search(question_lower):
+            return ("understand", "understanding")
 
         # Check research patterns
-        for pattern in RESEARCH_PATTERNS:
-            if re.search(pattern, question_lower):
-                return ("research", "facts")
+        if _RESEARCH_RE.search(question_lower):
+            return ("research", "facts")
 
         # Default to research for ambiguous questions
         return ("research", "facts")
@@ -2,9 +2,9 @@
 Persistence layer for Knowledge Forge sessions.
 
 Usage:
-    from server.persistence import SessionStore, Session
+    from server.persistence import get_session_store, Session
 
-    store = SessionStore()
+    store = get_session_store()
     session = store.create(mode="research")
     session = store.get(session_id)
     store.save(session)
@@ -52,7 +52,7 @@ from .models import (
 )
 
 from .file_backend import FileBackend
-from .session_store import SessionStore, SessionNotFoundError
+from .session_store import SessionStore, SessionNotFoundError, get_session_store
 
 __all__ = [
     # Core types
@@ -97,4 +97,5 @@ __all__ = [
     "FileBackend",
     "SessionStore",
     "SessionNotFoundError",
+    "get_session_store",
 ]
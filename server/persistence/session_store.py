@@ -6,6 +6,7 @@ Provides high-level API for session management.
 from __future__ import annotations
 
 from datetime import datetime, timezone
+from functools import lru_cache
 from typing import Optional
 from pathlib import Path
 import uuid
@@ -37,6 +38,9 @@ class SessionStore:
 
     def __init__(self, data_dir: Optional[Path] = None):
         self.backend = FileBackend(data_dir)
+        # Listing metadata by session ID; loaded from disk on first listing,
+        # then kept current by _save() and delete()
+        self._summaries: Optional[dict[str, dict]] = None
 
     # =========================================================================
     # CRUD Operations
@@ -126,6 +130,8 @@ class SessionStore:
         Returns:
             True if deleted, False if didn't exist
         """
+        if self._summaries is not None:
+            self._summaries.pop(session_id, None)
         return self.backend.delete_session(session_id)
 
     def list(self) -> list[str]:
@@ -144,23 +150,17 @@ class SessionStore:
         Returns:
             List of dicts with id, created, updated, mode, topic
         """
-        sessions = []
-        for session_id in self.list():
-            try:
-                session = self.get(session_id)
-                topic = ""
-                if session.journey_brief:
-                    topic = session.journey_brief.original_question[:50]
-                sessions.append({
-                    "id": session.id,
-                    "created": session.created.isoformat(),
-                    "updated": session.updated.isoformat(),
-                    "mode": session.mode,
-                    "topic": topic,
-                })
-            except Exception:
-                # Skip corrupted sessions
-                continue
+        if self._summaries is None:
+            summaries = {}
+            for session_id in self.list():
+                try:
+                    summaries[session_id] = self._summarize(self.get(session_id))
+                except Exception:
+                    # Skip corrupted sessions
+                    continue
+            self._summaries = summaries
+
+        sessions = [dict(s) for s in self._summaries.values()]
         return sorted(sessions, key=lambda x: x["updated"], reverse=True)
 
     def exists(self, session_id: str) -> bool:
@@ -250,3 +250,25 @@ class SessionStore:
             session.id,
             session.model_dump(mode="json", by_alias=True),
         )
+        if self._summaries is not None:
+            self._summaries[session.id] = self._summarize(session)
+
+    @staticmethod
+    def _summarize(session: Session) -> dict:
+        """Listing metadata for a session."""
+        topic = ""
+        if session.journey_brief:
+            topic = session.journey_brief.original_question[:50]
+        return {
+            "id": session.id,
+            "created": session.created.isoformat(),
+            "updated": session.updated.isoformat(),
+            "mode": session.mode,
+            "topic": topic,
+        }
+
+
+@lru_cache(maxsize=None)
+def get_session_store() -> SessionStore:
+    """Get the process-wide session store for the default data directory."""
+    return SessionStore()
@@ -2,13 +2,17 @@
 
 from __future__ import annotations
 
+import asyncio
+import json
 import tempfile
 from pathlib import Path
 import pytest
 from fastapi.testclient import TestClient
 
 from server.api.main import app
+from server.api import streaming
 from server.api.routes import journey, chat, session
+from server.api.streaming import SSEEvent, SSEStreamManager
 from server.persistence import SessionStore
 
 
@@ -230,5 +234,222 @@ class TestChatEndpoints:
         assert response.status_code == 400
 
 
+class TestSSEEvent:
+    """Test SSE event formatting."""
+
+    def test_format_frame(self):
+        """Test an event formats as a single SSE frame with a JSON body."""
+        event = SSEEvent(type="agent.thinking", payload={"message": "Thinking…"})
+
+        frame = event.format()
+
+        assert frame.startswith("event: agent.thinking\ndata: ")
+        assert frame.endswith("\n\n")
+        data = json.loads(frame[len("event: agent.thinking\ndata: "):])
+        assert data == event.to_dict()
+
+
+class TestSSEStreamManager:
+    """Test SSE stream delivery."""
+
+    @pytest.mark.asyncio
+    async def test_subscribe_coalesces_queued_events(self):
+        """Test events queued together are delivered as one chunk."""
+        manager = SSEStreamManager()
+        manager.create_stream("s1")
+        for i in range(3):
+            await manager.emit("s1", SSEEvent(type="agent.speaking", payload={"delta": str(i)}))
+
+        stream = manager.subscribe("s1")
+
+        chunk = await stream.__anext__()
+
+        assert chunk.count("event: agent.speaking\n") == 3
+        assert chunk.index('"delta":"0"') < chunk.index('"delta":"2"')
+
+        manager.close_stream("s1")
+        assert [rest async for rest in stream] == []
+
+    @pytest.mark.asyncio
+    async def test_subscribe_sends_keepalives(self, monkeypatch):
+        """Test an idle stream yields keepalive comments."""
+        monkeypatch.setattr(streaming, "KEEPALIVE_INTERVAL", 0.01)
+        manager = SSEStreamManager()
+        stream = manager.subscribe("s1")
+
+        chunk = await asyncio.wait_for(stream.__anext__(), 1)
+
+        assert chunk == ": keepalive\n\n"
+        manager.close_stream("s1")
+        assert [rest async for rest in stream] == []
+
+    @pytest.mark.asyncio
+    async def test_wait_all_closed(self):
+        """Test waiting returns once subscribers finish, or on timeout."""
+        manager = SSEStreamManager()
+        await manager.wait_all_closed(timeout=0)
+
+        manager.create_stream("s1")
+        await manager.emit("s1", SSEEvent(type="agent.thinking"))
+        stream = manager.subscribe("s1")
+        await stream.__anext__()
+
+        await manager.wait_all_closed(timeout=0.01)
+        assert not manager._all_closed.is_set()
+
+        manager.close_all_streams()
+        assert [rest async for rest in stream] == []
+        await asyncio.wait_for(manager.wait_all_closed(timeout=5), 1)
+        assert manager._all_closed.is_set()
+
+
+class TestChatWorkers:
+    """Test the chat worker pool."""
+
+    @pytest.mark.asyncio
+    async def test_workers_process_session_messages_in_order(self, monkeypatch):
+        """Test queued messages are processed, in order per session."""
+        processed = []
+
+        async def fake_process(session_id, message, context):
+            processed.append((session_id, message))
+
+        monkeypatch.setattr(chat, "process_chat_message", fake_process)
+
+        chat.start_chat_workers(count=2)
+        for i in range(3):
+            assert chat.enqueue_chat_message("s1", f"m{i}", None)
+        await chat._ready_sessions.join()
+
+        assert processed == [("s1", "m0"), ("s1", "m1"), ("s1", "m2")]
+        assert chat._session_pending == {}
+        await chat.stop_chat_workers()
+        assert not chat.enqueue_chat_message("s1", "late", None)
+
+    @pytest.mark.asyncio
+    async def test_queued_session_does_not_hold_workers(self, monkeypatch):
+        """Test a session's backlog uses one worker, leaving the rest free."""
+        release = asyncio.Event()
+        started = []
+
+        async def fake_process(session_id, message, context):
+            started.append((session_id, message))
+            if session_id == "busy":
+                await release.wait()
+
+        monkeypatch.setattr(chat, "process_chat_message", fake_process)
+
+        chat.start_chat_workers(count=4)
+        for i in range(4):
+            chat.enqueue_chat_message("busy", f"m{i}", None)
+        chat.enqueue_chat_message("other", "m0", None)
+        for _ in range(5):
+            await asyncio.sleep(0)
+
+        assert started == [("busy", "m0"), ("other", "m0")]
+
+        release.set()
+        await chat._ready_sessions.join()
+        assert [m for s, m in started if s == "busy"] == ["m0", "m1", "m2", "m3"]
+        await chat.stop_chat_workers()
+
+    @pytest.mark.asyncio
+    async def test_stop_cancels_runs_after_timeout(self, monkeypatch):
+        """Test shutdown doesn't wait for long runs or the backlog."""
+        cancelled = []
+
+        async def fake_process(session_id, message, context):
+            try:
+                await asyncio.Event().wait()
+            except asyncio.CancelledError:
+                cancelled.append(message)
+                raise
+
+        monkeypatch.setattr(chat, "process_chat_message", fake_process)
+
+        chat.start_chat_workers(count=1)
+        chat.enqueue_chat_message("s1", "m0", None)
+        chat.enqueue_chat_message("s1", "m1", None)
+        await asyncio.sleep(0)
+
+        await asyncio.wait_for(chat.stop_chat_workers(timeout=0.01), 1)
+
+        assert cancelled == ["m0"]
+        assert chat._session_pending == {}
+
+    @pytest.mark.asyncio
+    async def test_busy_session_does_not_block_others(self, monkeypatch):
+        """Test an idle worker picks up another session's message."""
+        release = asyncio.Event()
+        processed = []
+
+        async def fake_process(session_id, message, context):
+            if session_id == "slow":
+                await release.wait()
+            processed.append(session_id)
+
+        monkeypatch.setattr(chat, "process_chat_message", fake_process)
+
+        chat.start_chat_workers(count=2)
+        chat.enqueue_chat_message("slow", "m0", None)
+        chat.enqueue_chat_message("fast", "m0", None)
+        for _ in range(5):
+            await asyncio.sleep(0)
+        assert processed == ["fast"]
+
+        release.set()
+        await chat.stop_chat_workers()
+        assert processed == ["fast", "slow"]
+
+    @pytest.mark.asyncio
+    async def test_worker_survives_errors(self, monkeypatch):
+        """Test a failing message doesn't stop the worker."""
+        processed = []
+
+        async def fake_process(session_id, message, context):
+            if message == "bad":
+                raise RuntimeError("boom")
+            processed.append(message)
+
+        monkeypatch.setattr(chat, "process_chat_message", fake_process)
+
+        chat.start_chat_workers(count=1)
+        chat.enqueue_chat_message("s1", "bad", None)
+        chat.enqueue_chat_message("s1", "good", None)
+        await chat.stop_chat_workers()
+
+        assert processed == ["good"]
+
+    @pytest.mark.asyncio
+    async def test_full_queue_raises(self, monkeypatch):
+        """Test enqueueing past capacity fails instead of waiting."""
+        async def fake_process(session_id, message, context):
+            pass
+
+        monkeypatch.setattr(chat, "process_chat_message", fake_process)
+        monkeypatch.setattr(chat, "CHAT_QUEUE_SIZE", 1)
+
+        chat.start_chat_workers(count=1)
+        chat.enqueue_chat_message("s1", "m0", None)
+        with pytest.raises(asyncio.QueueFull):
+            chat.enqueue_chat_message("s1", "m1", None)
+        await chat.stop_chat_workers()
+
+    def test_send_chat_message_queue_full(self, client, temp_store, monkeypatch):
+        """Test the route returns 503 when the queue is full."""
+        session = temp_store.create(mode="research")
+
+        def full(*args):
+            raise asyncio.QueueFull
+
+        monkeypatch.setattr(chat, "enqueue_chat_message", full)
+
+        response = client.post(
+            "/api/chat",
+            json={"session_id": session.id, "message": "Hello"},
+        )
+        assert response.status_code == 503
+
+
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
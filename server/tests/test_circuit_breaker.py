@@ -0,0 +1,72 @@
+"""
+Tests for the SDK circuit breaker.
+"""
+
+import pytest
+
+from server.agents import circuit_breaker
+from server.agents.circuit_breaker import CircuitBreaker, CircuitOpenError
+
+
+class TestCircuitBreaker:
+    """Tests for CircuitBreaker."""
+
+    def test_opens_after_threshold(self):
+        """Test the circuit opens after consecutive failures."""
+        breaker = CircuitBreaker(failure_threshold=3, recovery_timeout=30)
+
+        breaker.record_failure()
+        breaker.record_failure()
+        assert not breaker.is_open
+        breaker.check()
+
+        breaker.record_failure()
+        assert breaker.is_open
+        with pytest.raises(CircuitOpenError):
+            breaker.check()
+
+    def test_success_resets_failures(self):
+        """Test a success closes the circuit and resets the count."""
+        breaker = CircuitBreaker(failure_threshold=2, recovery_timeout=30)
+
+        breaker.record_failure()
+        breaker.record_success()
+        breaker.record_failure()
+        assert not breaker.is_open
+
+        breaker.record_failure()
+        assert breaker.is_open
+        breaker.record_success()
+        assert not breaker.is_open
+
+    def test_recovers_after_timeout(self):
+        """Test calls are let through again once the timeout passes."""
+        breaker = CircuitBreaker(failure_threshold=1, recovery_timeout=0)
+
+        breaker.record_failure()
+
+        assert not breaker.is_open
+
+    def test_half_open_allows_single_probe(self, monkeypatch):
+        """Test only one call is let through after the timeout."""
+        now = [100.0]
+        monkeypatch.setattr(circuit_breaker, "monotonic", lambda: now[0])
+        breaker = CircuitBreaker(failure_threshold=2, recovery_timeout=30)
+        breaker.record_failure()
+        breaker.record_failure()
+
+        now[0] += 30
+        breaker.check()
+        with pytest.raises(CircuitOpenError):
+            breaker.check()
+
+        # A failed probe re-opens the circuit for a full timeout
+        breaker.record_failure()
+        now[0] += 29
+        assert breaker.is_open
+
+        now[0] += 1
+        breaker.check()
+        breaker.record_success()
+        breaker.check()
+        breaker.check()
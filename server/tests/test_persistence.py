@@ -12,6 +12,7 @@ from server.persistence import (
     ResearchModeData,
     Question,
     CategoryQuestion,
+    get_session_store,
 )
 
 
@@ -128,6 +129,28 @@ class TestSessionStore:
         assert sessions[0]["mode"] == "research"
         assert "Test question" in sessions[0]["topic"]
 
+    def test_list_with_metadata_tracks_changes(self, store):
+        """Test listing stays current without re-reading sessions."""
+        first = store.create(mode="research")
+        assert [s["id"] for s in store.list_with_metadata()] == [first.id]
+
+        def fail(session_id):
+            raise AssertionError("listing re-read a session")
+
+        store.get = fail
+        second = store.create(mode="build")
+        first.mode = "understand"
+        store.save(first)
+        store.delete(second.id)
+
+        sessions = store.list_with_metadata()
+        assert [s["id"] for s in sessions] == [first.id]
+        assert sessions[0]["mode"] == "understand"
+
+    def test_get_session_store_is_shared(self):
+        """Test the default store is created once per process."""
+        assert get_session_store() is get_session_store()
+
 
 class TestSessionUpdates:
     """Tests for specific update operations."""
@@ -210,6 +210,34 @@ class TestResearchPhaseContext:
         assert len(unanswered) == 1
         assert unanswered[0].id == "q-2"
 
+    def test_get_question(self):
+        """Test looking up a question by ID."""
+        ctx = ResearchPhaseContext()
+        question = Question(id="q-1", question="Test?", status="open")
+        ctx.add_question(question)
+
+        assert ctx.get_question("q-1") is question
+        assert ctx.get_question("q-missing") is None
+
+    def test_unanswered_count(self):
+        """Test the open-question counter tracks answers and skips."""
+        ctx = ResearchPhaseContext()
+        for i in range(1, 4):
+            ctx.add_question(Question(id=f"q-{i}", question=f"Test {i}?", status="open"))
+
+        assert ctx.unanswered_count == 3
+
+        ctx.mark_question_answered("q-1")
+        ctx.mark_question_answered("q-1")
+        ctx.skip_question("q-2")
+        ctx.mark_question_answered("q-unknown")
+
+        assert ctx.unanswered_count == 1
+        assert ctx.unanswered_count == len(ctx.get_unanswered_questions())
+
+        restored = ResearchPhaseContext.from_dict(ctx.to_dict())
+        assert restored.unanswered_count == 1
+
     def test_backward_trigger_detection(self):
         """Test backward trigger detection."""
         ctx = ResearchPhaseContext()
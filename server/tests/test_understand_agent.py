@@ -11,7 +11,7 @@ Tests cover:
 """
 
 import pytest
-from unittest.mock import AsyncMock
+from unittest.mock import AsyncMock, Mock
 
 from server.agents.understand import (
     UnderstandAgent,
@@ -19,6 +19,7 @@ from server.agents.understand import (
     UnderstandPhaseContext,
 )
 from server.agents.understand.phases import UNDERSTAND_TRANSITIONS
+from server.agents.understand.agent import _parse_list_string
 from server.agents.base import PhaseTransition, CheckpointResponse
 from server.persistence import (
     Session,
@@ -164,6 +165,54 @@ class TestUnderstandPhaseContext:
         assert "slo-1" in ctx.knowledge_states
         assert ctx.slo_counters["slo-1"]["total_rounds"] == 0
 
+    def test_get_current_snapshot(self):
+        """Test the current SLO snapshot matches the individual getters."""
+        ctx = UnderstandPhaseContext()
+        assert ctx.get_current_snapshot() == (None, None, None)
+
+        ctx.add_slo(SLO(id="slo-1", statement="First SLO", frame="EXPLAIN"))
+        ctx.selected_slo_ids = ["slo-1"]
+
+        slo, counters, state = ctx.get_current_snapshot()
+
+        assert slo is ctx.get_current_slo()
+        assert counters is ctx.get_current_counters()
+        assert state is ctx.get_current_knowledge_state()
+
+    def test_get_slo(self):
+        """Test SLO lookup by ID survives a round trip."""
+        ctx = UnderstandPhaseContext()
+        ctx.add_slo(SLO(id="slo-1", statement="First SLO", frame="EXPLAIN"))
+
+        assert ctx.get_slo("slo-1").statement == "First SLO"
+        assert ctx.get_slo("slo-2") is None
+        assert ctx.get_slo(None) is None
+
+        restored = UnderstandPhaseContext.from_dict(ctx.to_dict())
+        assert restored.get_slo("slo-1").statement == "First SLO"
+
+    def test_next_slo_id(self):
+        """Test SLO IDs are sequential within a session."""
+        ctx = UnderstandPhaseContext()
+        assert ctx.next_slo_id() == "slo-1"
+
+        ctx.add_slo(SLO(id=ctx.next_slo_id(), statement="First SLO", frame="EXPLAIN"))
+
+        assert ctx.next_slo_id() == "slo-2"
+        restored = UnderstandPhaseContext.from_dict(ctx.to_dict())
+        assert restored.next_slo_id() == "slo-2"
+
+    def test_get_slo_dump_is_cached(self):
+        """Test SLO dumps are computed once and reused."""
+        ctx = UnderstandPhaseContext()
+        slo = SLO(id="slo-1", statement="First SLO", frame="EXPLAIN")
+        ctx.add_slo(slo)
+
+        dump = ctx.get_slo_dump(slo)
+
+        assert dump == slo.model_dump(by_alias=True, mode="json")
+        assert ctx.get_slo_dump(slo) is dump
+
     def test_get_current_slo(self):
         """Test getting current SLO."""
         ctx = UnderstandPhaseContext()
@@ -316,6 +365,36 @@ class TestUnderstandPhaseContext:
         assert restored.slo_counters["slo-1"]["total_rounds"] == 1
 
 
+# =============================================================================
+# Tool Argument Parsing Tests
+# =============================================================================
+
+class TestParseListString:
+    """Tests for the list-argument parser shared by the SLO tools."""
+
+    def test_bullet_lines(self):
+        """Test newline and escaped-newline bullets are split and stripped."""
+        raw = "- first\\n* second\n  • third\n\n"
+        assert _parse_list_string(raw) == ["first", "second", "third"]
+
+    def test_only_newlines_split(self):
+        """Test other line boundaries such as U+2028 stay within an item."""
+        assert _parse_list_string("x\u2028y\n- z") == ["x\u2028y", "z"]
+
+    def test_unicode_whitespace_before_bullet(self):
+        """Test non-ASCII whitespace around bullets is stripped."""
+        assert _parse_list_string("a\n\xa0- b\n-\u3000* c") == ["a", "b", "c"]
+
+    def test_json_array(self):
+        """Test JSON arrays are decoded directly."""
+        assert _parse_list_string('["a", "b"]') == ["a", "b"]
+
+    def test_passthrough_and_invalid(self):
+        """Test lists pass through and other types yield an empty list."""
+        assert _parse_list_string(["x"]) == ["x"]
+        assert _parse_list_string(None) == []
+
+
 # =============================================================================
 # Understand Agent Tests
 # =============================================================================
@@ -417,6 +496,29 @@ class TestUnderstandAgent:
         assert new_agent.phase_context.pace == "focused"
         assert len(new_agent.phase_context.slos) == 1
 
+    @pytest.mark.asyncio
+    async def test_checkpoint_message_built_only_with_handler(
+        self, understand_agent, mock_session, mock_journey_brief
+    ):
+        """Test checkpoint messages are skipped when nothing will show them."""
+        await understand_agent.initialize(mock_journey_brief)
+        await understand_agent._handle_phase_checkpoint(UnderstandPhase.CONFIGURE)
+
+        checkpoint = understand_agent._checkpoint_handler.await_args.args[0]
+        assert checkpoint.id == "configure_approval"
+        assert "standard" in checkpoint.message
+        assert understand_agent.phase_context.session_configured is True
+
+        # Without a handler the checkpoint auto-approves and the message is never built
+        agent = UnderstandAgent(session=mock_session, emit_event=AsyncMock())
+        await agent.initialize(mock_journey_brief)
+        build_message = Mock(return_value="unused")
+
+        response = await agent._request_checkpoint("test", build_message, options=[])
+
+        assert response.approved is True
+        build_message.assert_not_called()
+
     def test_prompt_generation_initial(self, understand_agent, mock_journey_brief):
         """Test initial prompt generation."""
         understand_agent.journey_brief = mock_journey_brief